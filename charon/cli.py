@@ -12,7 +12,7 @@ Usage:
   python -m charon.cli run-one <id> [--dry-run] [--tailor] [--submit]
   python -m charon.cli submit <id> [--tailor] [--force]
   python -m charon.cli detect <url>
-  python -m charon.cli scrape <source> [--query QUERY]
+  python -m charon.cli scrape <source> [<source> ...] [--query QUERY]
   python -m charon.cli daemon [--interval SEC] [--install] [--uninstall]
   python -m charon.cli dashboard [--port PORT]
   python -m charon.cli stats
@@ -26,7 +26,7 @@ from pathlib import Path
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from charon.queue import add_job, update_status, get_jobs, get_job, stats
+from charon.queue import add_job, update_status, update_status_bulk, get_jobs, get_job, stats
 from charon.detector import detect, detect_from_url, is_supported, SUPPORTED
 from charon.config import load_answers
 
@@ -48,6 +48,15 @@ def get_filler(platform: str):
     return None
 
 
+async def _pooled(coro):
+    """Await coro, then close the shared browser any filler launched."""
+    from charon.filler import POOL
+    try:
+        return await coro
+    finally:
+        await POOL.shutdown()
+
+
 def tailor_for_job(job: dict) -> str:
     """Run tailor.py for a job. Returns PDF path or None."""
     jd_text = job.get("jd_text")
@@ -171,8 +180,7 @@ def cmd_approve(args):
 def cmd_approve_all(args):
     """Approve all scraped jobs."""
     jobs = get_jobs("scraped")
-    for j in jobs:
-        update_status(j["id"], "approved")
+    update_status_bulk([(j["id"], "approved") for j in jobs])
     print(f"Approved {len(jobs)} jobs")
 
 
@@ -290,7 +298,7 @@ def cmd_run(args):
                 results["failed"] += 1
         return results
 
-    results = asyncio.run(run_all())
+    results = asyncio.run(_pooled(run_all()))
     action = "submitted" if do_submit else "filled"
     print(f"\nDone: {results['success']} {action}, {results['failed']} failed")
 
@@ -305,7 +313,7 @@ def cmd_run_one(args):
     do_tailor = getattr(args, "tailor", False)
     do_submit = getattr(args, "submit", False)
 
-    asyncio.run(_process_job(job, dry_run, do_tailor, do_submit))
+    asyncio.run(_pooled(_process_job(job, dry_run, do_tailor, do_submit)))
 
 
 def cmd_submit(args):
@@ -325,18 +333,18 @@ def cmd_submit(args):
             return
 
     do_tailor = getattr(args, "tailor", False)
-    asyncio.run(_process_job(job, dry_run=False, do_tailor=do_tailor, do_submit=True))
+    asyncio.run(_pooled(_process_job(job, dry_run=False, do_tailor=do_tailor, do_submit=True)))
 
 
 def cmd_scrape(args):
-    """Scrape jobs from a source and add to queue."""
-    from charon.scraper import scrape, add_scraped_jobs
+    """Scrape jobs from one or more sources and add to queue."""
+    from charon.scraper import scrape_many, add_scraped_jobs
 
-    source = args.source
+    sources = args.source
     query = getattr(args, "query", None)
 
-    print(f"Scraping: {source}" + (f" (filter: {query})" if query else ""))
-    jobs = scrape(source, query)
+    print(f"Scraping: {', '.join(sources)}" + (f" (filter: {query})" if query else ""))
+    jobs = asyncio.run(scrape_many(sources, query))
 
     if not jobs:
         print("No jobs found.")
@@ -345,7 +353,7 @@ def cmd_scrape(args):
     print(f"Found {len(jobs)} jobs")
 
     # Add to queue
-    result = add_scraped_jobs(jobs, source=source.split(":")[0])
+    result = add_scraped_jobs(jobs, source=sources[0].split(":")[0])
     print(f"Added {result['added']} new jobs ({result['skipped']} already in queue)")
 
 
@@ -442,7 +450,7 @@ def main():
 
     # scrape
     p_scrape = sub.add_parser("scrape", help="Scrape jobs from a source")
-    p_scrape.add_argument("source", help="Source: lever:<co>, greenhouse:<co>, ashby:<co>, hn, wellfound")
+    p_scrape.add_argument("source", nargs="+", help="Source(s): lever:<co>, greenhouse:<co>, ashby:<co>, hn, wellfound")
     p_scrape.add_argument("--query", "-q", help="Role filter (e.g. 'software engineer')")
 
     # daemon
@@ -11,6 +11,11 @@ RESUME_DIR = BASE_DIR / "resume"
 ANSWERS_FILE = BASE_DIR / "answers.yaml"
 APPLICANT_FILE = RESUME_DIR / "APPLICANT.md"
 DB_FILE = CHARON_DIR / "jobs.db"
+HTTP_CACHE_DIR = CHARON_DIR / ".http_cache"
+
+# Scraper cache: board API bodies are revalidated with ETag/Last-Modified;
+# filtered job lists are reused as-is for this long
+SCRAPE_CACHE_TTL_SEC = 600
 
 # Stealth settings
 MIN_DELAY_SEC = 2.0
@@ -21,6 +26,9 @@ PAGE_LOAD_WAIT_SEC = 3.0
 # Browser settings
 HEADLESS = False  # set True for daemon mode
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+# Resource types aborted in filler contexts (not needed to fill forms).
+# Stylesheets stay: visibility checks depend on them. Empty to disable.
+BLOCKED_RESOURCE_TYPES = ("image", "media", "font")
 
 
 def load_answers() -> dict:
@@ -189,6 +189,8 @@ async def process_job(job: dict, logger, dry_run: bool = False) -> bool:
         update_status(job_id, "failed", error=str(e))
         logger.error(f"  Exception: {e}")
         return False
+    finally:
+        await filler.cleanup()
 
 
 async def run_queue(logger, dry_run: bool = False, max_jobs: int = 0) -> dict:
@@ -204,24 +206,30 @@ async def run_queue(logger, dry_run: bool = False, max_jobs: int = 0) -> dict:
     logger.info(f"Processing {len(jobs)} approved jobs")
     results = {"processed": 0, "success": 0, "failed": 0}
 
-    for job in jobs:
-        try:
-            ok = await process_job(job, logger, dry_run)
-            results["processed"] += 1
-            if ok:
-                results["success"] += 1
-            else:
+    try:
+        for job in jobs:
+            try:
+                ok = await process_job(job, logger, dry_run)
+                results["processed"] += 1
+                if ok:
+                    results["success"] += 1
+                else:
+                    results["failed"] += 1
+            except Exception as e:
+                logger.error(f"Unexpected error on #{job['id']}: {e}")
+                results["processed"] += 1
                 results["failed"] += 1
-        except Exception as e:
-            logger.error(f"Unexpected error on #{job['id']}: {e}")
-            results["processed"] += 1
-            results["failed"] += 1
 
-        # Delay between jobs
+            # Delay between jobs
+            if not dry_run:
+                delay = 30 + (hash(job["url"]) % 60)  # 30-90s between jobs
+                logger.info(f"  Waiting {delay}s before next job...")
+                await asyncio.sleep(delay)
+    finally:
+        # Close the Chromium instance shared by this run's fillers
         if not dry_run:
-            delay = 30 + (hash(job["url"]) % 60)  # 30-90s between jobs
-            logger.info(f"  Waiting {delay}s before next job...")
-            await asyncio.sleep(delay)
+            from .filler import POOL
+            await POOL.shutdown()
 
     return results
 
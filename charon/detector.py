@@ -7,6 +7,7 @@ Detection methods:
 """
 
 import re
+from functools import lru_cache
 from urllib.parse import urlparse
 
 
@@ -39,6 +40,7 @@ PLATFORM_PATTERNS = [
 ]
 
 
+@lru_cache(maxsize=4096)
 def detect_from_url(url: str) -> str:
     """Detect ATS platform from URL pattern. Returns platform name or 'unknown'."""
     for pattern, platform in PLATFORM_PATTERNS:
@@ -2,6 +2,9 @@
 Base form filler. Platform-specific handlers extend this.
 Handles common operations: browser launch, resume upload, field detection.
 Includes retry logic, screenshot capture on failure, and post-fill validation.
+
+Chromium is launched once per run through the module-level POOL; each filler
+gets its own BrowserContext. Callers close the browser with POOL.shutdown().
 """
 
 import asyncio
@@ -9,7 +12,7 @@ from pathlib import Path
 from datetime import datetime
 from playwright.async_api import async_playwright, Page, BrowserContext
 
-from .config import HEADLESS, USER_AGENT, PAGE_LOAD_WAIT_SEC
+from .config import HEADLESS, USER_AGENT, PAGE_LOAD_WAIT_SEC, BLOCKED_RESOURCE_TYPES
 from .stealth import setup_stealth, human_delay
 from .answers import get_answer
 from .detector import detect
@@ -17,10 +20,71 @@ from .detector import detect
 SCREENSHOT_DIR = Path(__file__).parent.parent / "logs" / "screenshots"
 
 
+async def _block_assets(route):
+    """Abort images/fonts/media; everything else loads normally."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserPool:
+    """Shared Chromium process. Hands out a fresh, stealth-patched context per job."""
+
+    def __init__(self):
+        self.pw = None
+        self.browser = None
+        self._lock = asyncio.Lock()
+
+    async def new_context(self) -> BrowserContext:
+        async with self._lock:
+            if self.browser is None or not self.browser.is_connected():
+                await self.shutdown()
+                self.pw = await async_playwright().start()
+                self.browser = await self.pw.chromium.launch(
+                    headless=HEADLESS,
+                    args=[
+                        "--disable-blink-features=AutomationControlled",
+                        "--no-first-run",
+                        "--no-default-browser-check",
+                    ]
+                )
+        context = await self.browser.new_context(
+            user_agent=USER_AGENT,
+            viewport={"width": 1440, "height": 900},
+            locale="en-US",
+        )
+        await setup_stealth(context)
+        if BLOCKED_RESOURCE_TYPES:
+            await context.route("**/*", _block_assets)
+        return context
+
+    async def shutdown(self):
+        """Close the shared browser. Safe to call when nothing was launched."""
+        if self.browser:
+            try:
+                await self.browser.close()
+            except Exception:
+                pass
+        if self.pw:
+            try:
+                await self.pw.stop()
+            except Exception:
+                pass
+        self.browser = None
+        self.pw = None
+
+
+POOL = BrowserPool()
+
+
 class FormFiller:
     """Base class for ATS form fillers."""
 
     platform = "unknown"
+    # Load state to wait for on navigation. Server-rendered forms override
+    # with "domcontentloaded"; SPAs need the network to settle.
+    wait_until = "networkidle"
 
     def __init__(self, job: dict, resume_path: str, answers_override: dict = None):
         self.job = job
@@ -28,30 +92,14 @@ class FormFiller:
         self.answers_override = answers_override or {}
         self.page = None
         self.context = None
-        self.browser = None
-        self.pw = None
         self.log = []
 
     async def start_browser(self):
-        self.pw = await async_playwright().start()
-        self.browser = await self.pw.chromium.launch(
-            headless=HEADLESS,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-first-run",
-                "--no-default-browser-check",
-            ]
-        )
-        self.context = await self.browser.new_context(
-            user_agent=USER_AGENT,
-            viewport={"width": 1440, "height": 900},
-            locale="en-US",
-        )
-        await setup_stealth(self.context)
+        self.context = await POOL.new_context()
         self.page = await self.context.new_page()
 
     async def navigate(self, url: str):
-        await self.page.goto(url, wait_until="networkidle", timeout=30000)
+        await self.page.goto(url, wait_until=self.wait_until, timeout=30000)
         await human_delay(PAGE_LOAD_WAIT_SEC, PAGE_LOAD_WAIT_SEC + 2)
 
     async def upload_resume(self, selector: str):
@@ -204,17 +252,8 @@ class FormFiller:
             try:
                 if attempt > 0:
                     self._log("info", f"Retry attempt {attempt}/{max_retries}")
-                    # Close previous browser if any
-                    if self.browser:
-                        try:
-                            await self.browser.close()
-                        except Exception:
-                            pass
-                    if self.pw:
-                        try:
-                            await self.pw.stop()
-                        except Exception:
-                            pass
+                    # Close previous context if any
+                    await self.cleanup()
 
                 await self.start_browser()
                 await self.navigate(self.job["url"])
@@ -252,17 +291,14 @@ class FormFiller:
         # The caller should handle browser cleanup
 
     async def cleanup(self):
-        """Clean up browser resources."""
-        if self.browser:
-            try:
-                await self.browser.close()
-            except Exception:
-                pass
-        if self.pw:
+        """Close this filler's context. The shared browser stays up for the next job."""
+        if self.context:
             try:
-                await self.pw.stop()
+                await self.context.close()
             except Exception:
                 pass
+        self.context = None
+        self.page = None
 
     def _log(self, level: str, msg: str):
         self.log.append({"level": level, "msg": msg})
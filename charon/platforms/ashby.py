@@ -50,15 +50,22 @@ class AshbyFiller(FormFiller):
             "city": personal.get("city", ""),
         }
 
-        # Find all form fields by label
+        # Find all form fields by label. Handles come from one snapshot and
+        # their text and `for` are read in one evaluate over those same
+        # handles, so rows and handles stay paired even if fills change the DOM
         labels = await page.query_selector_all("label")
-        for label_el in labels:
+        label_rows = await page.evaluate(
+            "els => els.map(e => ({text: (e.innerText || '').trim().toLowerCase(),"
+            " for: e.getAttribute('for') || ''}))",
+            labels,
+        )
+        for label_el, row in zip(labels, label_rows):
             try:
-                label_text = (await label_el.inner_text()).strip().lower()
+                label_text = row["text"]
                 for field_name, value in field_labels.items():
                     if field_name in label_text and value:
                         # Find associated input
-                        for_attr = await label_el.get_attribute("for")
+                        for_attr = row["for"]
                         if for_attr:
                             input_el = await page.query_selector(f"#{for_attr}")
                         else:
@@ -94,16 +101,17 @@ class AshbyFiller(FormFiller):
             except Exception as e:
                 continue
 
-        # Resume upload (if not already handled via label matching)
-        file_inputs = await page.query_selector_all('input[type="file"]')
-        for fi in file_inputs:
-            name = await fi.get_attribute("name") or ""
-            accept = await fi.get_attribute("accept") or ""
-            if "resume" in name.lower() or "cv" in name.lower() or ".pdf" in accept:
-                await fi.set_input_files(str(self.resume_path))
-                self._log("ok", "Uploaded resume (file input)")
-                await human_delay(1, 2)
-                break
+        # Resume upload (if not already handled via label matching). The
+        # name/accept match runs in the selector engine: first hit in DOM order
+        fi = await page.query_selector(
+            'input[type="file"][name*="resume" i], '
+            'input[type="file"][name*="cv" i], '
+            'input[type="file"][accept*=".pdf"]'
+        )
+        if fi:
+            await fi.set_input_files(str(self.resume_path))
+            self._log("ok", "Uploaded resume (file input)")
+            await human_delay(1, 2)
 
         # Custom questions - find remaining unfilled fields
         all_fields = await page.query_selector_all("[class*='field'], [class*='question']")
@@ -18,6 +18,7 @@ from ..config import load_answers
 
 class GreenhouseFiller(FormFiller):
     platform = "greenhouse"
+    wait_until = "domcontentloaded"  # server-rendered form
 
     async def fill(self) -> dict:
         answers = load_answers()
@@ -19,6 +19,7 @@ from ..config import load_answers
 
 class LeverFiller(FormFiller):
     platform = "lever"
+    wait_until = "domcontentloaded"  # server-rendered form
 
     async def fill(self) -> dict:
         answers = load_answers()
@@ -29,6 +29,24 @@ from ..filler import FormFiller
 from ..stealth import human_type, human_click, human_delay
 from ..config import load_answers
 
+# URL fragments that identify Workday's sign-in and review steps
+AUTH_URL_MARKERS = ("login", "signin", "account")
+REVIEW_URL_MARKERS = ("/review", "/summary")
+
+# Personal info fields: (selector, answers.yaml personal key, fast_fill).
+# Workday uses data-automation-id attributes extensively. Fast-filled
+# fields are set in one call instead of typed per keystroke; only used
+# where Workday doesn't watch typing cadence.
+FIELD_PLAN = (
+    ('input[data-automation-id="legalNameSection_firstName"]', "first_name", False),
+    ('input[data-automation-id="legalNameSection_lastName"]', "last_name", False),
+    ('input[data-automation-id="addressSection_addressLine1"]', "address", False),
+    ('input[data-automation-id="addressSection_city"]', "city", False),
+    ('input[data-automation-id="addressSection_postalCode"]', "zip", True),
+    ('input[data-automation-id="phone-number"]', "phone_digits", True),
+    ('input[data-automation-id="email"]', "email", True),
+)
+
 
 class WorkdayFiller(FormFiller):
     platform = "workday"
@@ -64,14 +82,22 @@ class WorkdayFiller(FormFiller):
             # Fill all visible fields on the current page
             await self._fill_current_page(personal, answers)
 
-            # Upload resume if we see a file input
-            file_inputs = await page.query_selector_all('input[type="file"]')
-            for fi in file_inputs:
-                accept = await fi.get_attribute("accept") or ""
-                name = await fi.get_attribute("name") or ""
-                data_auto = await fi.get_attribute("data-automation-id") or ""
-                if any(kw in (accept + name + data_auto).lower() for kw in ["resume", "cv", "pdf", "doc", "file"]):
-                    await fi.set_input_files(str(self.resume_path))
+            # Upload resume if we see a file input. Attributes for every
+            # input are read in one evaluate instead of three calls each.
+            file_attrs = await page.eval_on_selector_all(
+                'input[type="file"]',
+                'els => els.map(e => (e.getAttribute("accept") || "")'
+                ' + (e.getAttribute("name") || "")'
+                ' + (e.getAttribute("data-automation-id") || ""))'
+            )
+            matches = [i for i, attrs in enumerate(file_attrs)
+                       if any(kw in attrs.lower() for kw in ["resume", "cv", "pdf", "doc", "file"])]
+            if matches:
+                file_inputs = await page.query_selector_all('input[type="file"]')
+                for i in matches:
+                    if i >= len(file_inputs):
+                        break
+                    await file_inputs[i].set_input_files(str(self.resume_path))
                     self._log("ok", "Uploaded resume")
                     await human_delay(1, 2)
 
@@ -93,12 +119,23 @@ class WorkdayFiller(FormFiller):
             'button:has-text("Apply")',
         ]
         for sel in selectors:
-            try:
-                el = await self.page.query_selector(sel)
-                if el and await el.is_visible():
-                    return el
-            except Exception:
-                continue
+            el = await self._locate(sel)
+            if el:
+                return el
+        return None
+
+    async def _locate(self, selector: str):
+        """
+        Return a locator for the first visible match, or None.
+        Locators pierce open shadow roots (where Workday's React components
+        render their inputs), so no separate handle + visibility probe is needed.
+        """
+        loc = self.page.locator(selector).first
+        try:
+            if await loc.is_visible():
+                return loc
+        except Exception:
+            pass
         return None
 
     async def _handle_auth(self, answers: dict) -> bool:
@@ -107,6 +144,18 @@ class WorkdayFiller(FormFiller):
         personal = answers.get("personal", {})
         email = personal.get("email", "")
 
+        # Sign-in URLs are a cheap positive. Tenants that show sign-in on the
+        # apply URL itself (.../apply/applyManually) are caught by the account
+        # form's submit buttons or a password field; without either, no auth.
+        if not any(m in page.url.lower() for m in AUTH_URL_MARKERS):
+            auth_form = await page.query_selector(
+                'button[data-automation-id="createAccountSubmitButton"], '
+                'button[data-automation-id="signInSubmitButton"], '
+                'input[type="password"]'
+            )
+            if not auth_form:
+                return True
+
         # Check if sign-in page is showing
         email_field = await page.query_selector(
             'input[data-automation-id="email"], '
@@ -179,24 +228,16 @@ class WorkdayFiller(FormFiller):
         """Fill all visible fields on the current Workday form page."""
         page = self.page
 
-        # Workday uses data-automation-id attributes extensively
-        field_map = {
-            'input[data-automation-id="legalNameSection_firstName"]': personal.get("first_name", ""),
-            'input[data-automation-id="legalNameSection_lastName"]': personal.get("last_name", ""),
-            'input[data-automation-id="addressSection_addressLine1"]': personal.get("address", ""),
-            'input[data-automation-id="addressSection_city"]': personal.get("city", ""),
-            'input[data-automation-id="addressSection_postalCode"]': personal.get("zip", ""),
-            'input[data-automation-id="phone-number"]': personal.get("phone_digits", ""),
-            'input[data-automation-id="email"]': personal.get("email", ""),
-        }
-
-        for selector, value in field_map.items():
+        for selector, key, fast_fill in FIELD_PLAN:
+            value = personal.get(key)
             if not value:
                 continue
             try:
-                el = await page.query_selector(selector)
-                if el and await el.is_visible():
-                    await human_type(page, selector, value)
+                if await self._locate(selector):
+                    if fast_fill:
+                        await page.fill(selector, value)
+                    else:
+                        await human_type(page, selector, value)
                     self._log("ok", f"Filled {selector.split('\"')[1]}")
                     await human_delay(0.3, 0.8)
             except Exception:
@@ -364,8 +405,8 @@ class WorkdayFiller(FormFiller):
 
         for sel in next_selectors:
             try:
-                btn = await page.query_selector(sel)
-                if btn and await btn.is_visible():
+                btn = await self._locate(sel)
+                if btn:
                     # Check if this is a submit button (stop if so)
                     btn_text = (await btn.inner_text()).strip().lower()
                     if any(w in btn_text for w in ["submit", "review", "confirm"]):
@@ -382,10 +423,29 @@ class WorkdayFiller(FormFiller):
         self._log("info", "No next button found - may be final page")
         return False
 
+    async def _on_review_page(self) -> bool:
+        """
+        True if the review/submit step is showing. The URL is a cheap positive;
+        tenants that keep one URL for every step are checked through the
+        bottom navigation button, the same way _click_next spots the last page.
+        """
+        if any(m in self.page.url.lower() for m in REVIEW_URL_MARKERS):
+            return True
+        if await self._locate('button[data-automation-id="submitButton"]'):
+            return True
+        btn = await self._locate('button[data-automation-id="bottom-navigation-next-button"]')
+        if not btn:
+            return False
+        btn_text = (await btn.inner_text()).strip().lower()
+        return any(w in btn_text for w in ["submit", "review", "confirm"])
+
     async def submit(self) -> bool:
         """Click the submit button on Workday."""
         page = self.page
         try:
+            if not await self._on_review_page():
+                self._log("error", f"Not on review page: {page.url}")
+                return False
             submit_selectors = [
                 'button[data-automation-id="submitButton"]',
                 'button[data-automation-id="bottom-navigation-next-button"]:has-text("Submit")',
@@ -393,8 +453,7 @@ class WorkdayFiller(FormFiller):
                 'button:has-text("Submit")',
             ]
             for sel in submit_selectors:
-                btn = await page.query_selector(sel)
-                if btn and await btn.is_visible():
+                if await self._locate(sel):
                     await human_click(page, sel)
                     await human_delay(2, 4)
                     self._log("ok", "Submitted application")
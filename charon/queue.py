@@ -14,14 +14,28 @@ Statuses:
 """
 
 import sqlite3
-from datetime import datetime
 from pathlib import Path
 from .config import DB_FILE
 
 
+# Database files whose schema and journal mode were set up by this process
+_initialized = set()
+
+
 def get_db() -> sqlite3.Connection:
     db = sqlite3.connect(str(DB_FILE))
     db.row_factory = sqlite3.Row
+    # Per-connection settings: one fsync per WAL checkpoint instead of per
+    # commit, temp tables in memory, reads through mmap
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute("PRAGMA temp_store=MEMORY")
+    db.execute("PRAGMA mmap_size=268435456")
+    if DB_FILE in _initialized:
+        return db
+
+    # WAL is persistent in the file, so it and the schema only need doing once;
+    # readers (dashboard, CLI) then aren't blocked by scraper inserts
+    db.execute("PRAGMA journal_mode=WAL")
     db.execute("""
         CREATE TABLE IF NOT EXISTS jobs (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -52,29 +66,91 @@ def get_db() -> sqlite3.Connection:
         )
     """)
     db.commit()
+    _initialized.add(DB_FILE)
     return db
 
 
+# URLs already in each queue database, loaded once per process and grown by
+# add_job/add_jobs_bulk. Only exact with a single writer: rows another process
+# (daemon vs. CLI) inserts later are missed until restart. Jobs are never
+# deleted, so a stale set only ever answers "not there" for an existing URL,
+# and UNIQUE(url) still rejects those on insert.
+_known_urls = {}
+
+
+def known_urls() -> set:
+    urls = _known_urls.get(DB_FILE)
+    if urls is None:
+        db = get_db()
+        urls = _known_urls[DB_FILE] = {row[0] for row in db.execute("SELECT url FROM jobs")}
+        db.close()
+    return urls
+
+
+def _remember_url(url: str):
+    # Only grow a set that is already loaded; the first known_urls() call reads it all
+    urls = _known_urls.get(DB_FILE)
+    if urls is not None:
+        urls.add(url)
+
+
+def url_exists(url: str) -> bool:
+    """
+    True if a job with this URL is known to be in the queue. Served from the
+    per-process cache, so with several writers a False may be stale; use it to
+    skip work, not as a uniqueness check.
+    """
+    return url in known_urls()
+
+
 def add_job(company: str, role: str, url: str, platform: str = None,
             jd_text: str = None, source: str = "manual") -> int:
     db = get_db()
     try:
         cur = db.execute(
-            "INSERT INTO jobs (company, role, url, platform, jd_text, source, scraped_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (company, role, url, platform, jd_text, source, datetime.now().isoformat())
+            "INSERT INTO jobs (company, role, url, platform, jd_text, source, scraped_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, datetime('now'))",
+            (company, role, url, platform, jd_text, source)
         )
         db.commit()
+        _remember_url(url)
         return cur.lastrowid
     except sqlite3.IntegrityError:
         # URL already exists
+        _remember_url(url)
         row = db.execute("SELECT id FROM jobs WHERE url = ?", (url,)).fetchone()
         return row["id"] if row else -1
 
 
+def add_jobs_bulk(rows: list) -> tuple:
+    """
+    Insert many jobs in one transaction. Rows already in the queue (same URL)
+    are ignored. rows: (company, role, url, platform, jd_text, source) tuples.
+    Returns (added, skipped).
+    """
+    known = known_urls()
+    new = [r for r in rows if r[2] not in known]
+    if not new:
+        return 0, len(rows)
+    db = get_db()
+    before = db.total_changes
+    db.execute("BEGIN")
+    db.executemany(
+        "INSERT OR IGNORE INTO jobs (company, role, url, platform, jd_text, source, scraped_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, datetime('now'))",
+        new,
+    )
+    db.commit()
+    known.update(r[2] for r in new)
+    added = db.total_changes - before
+    return added, len(rows) - added
+
+
 def update_status(job_id: int, status: str, error: str = None, resume_path: str = None):
     db = get_db()
-    fields = ["status = ?", "updated_at = ?"]
-    values = [status, datetime.now().isoformat()]
+    # Timestamps come from SQLite (UTC), same as the created_at default
+    fields = ["status = ?", "updated_at = datetime('now')"]
+    values = [status]
     if error is not None:
         fields.append("error = ?")
         values.append(error)
@@ -82,13 +158,40 @@ def update_status(job_id: int, status: str, error: str = None, resume_path: str
         fields.append("resume_path = ?")
         values.append(resume_path)
     if status == "submitted":
-        fields.append("submitted_at = ?")
-        values.append(datetime.now().isoformat())
+        fields.append("submitted_at = datetime('now')")
     values.append(job_id)
     db.execute(f"UPDATE jobs SET {', '.join(fields)} WHERE id = ?", values)
     db.commit()
 
 
+def update_status_bulk(updates: list):
+    """
+    Apply many status updates in one transaction (one commit instead of N).
+    updates: (job_id, status) or (job_id, status, error, resume_path) tuples.
+    None for error/resume_path leaves the stored value unchanged.
+    """
+    rows = []
+    for u in updates:
+        job_id, status = u[0], u[1]
+        error = u[2] if len(u) > 2 else None
+        resume_path = u[3] if len(u) > 3 else None
+        rows.append((status, error, resume_path, status, job_id))
+    if not rows:
+        return
+    db = get_db()
+    db.execute("BEGIN IMMEDIATE")
+    db.executemany("""
+        UPDATE jobs SET
+            status = ?,
+            updated_at = datetime('now'),
+            error = COALESCE(?, error),
+            resume_path = COALESCE(?, resume_path),
+            submitted_at = CASE WHEN ? = 'submitted' THEN datetime('now') ELSE submitted_at END
+        WHERE id = ?
+    """, rows)
+    db.commit()
+
+
 def get_jobs(status: str = None) -> list:
     db = get_db()
     if status:
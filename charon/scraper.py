@@ -2,7 +2,13 @@
 Job scraper. Feeds the queue from job board APIs and web sources.
 
 All three major ATS platforms have public JSON APIs for their job boards.
-No browser needed, no selector guessing, no footer junk.
+No browser needed, no selector guessing, no footer junk. Board scrapers are
+async and share one httpx.AsyncClient, so scrape_many() can fetch several
+boards concurrently over a single connection pool.
+
+Responses are cached under charon/.http_cache/: API bodies are revalidated
+with If-None-Match/If-Modified-Since (a 304 skips download and decode), and
+each source's filtered job list is reused for SCRAPE_CACHE_TTL_SEC.
 
 Sources:
 - Lever API (api.lever.co/v0/postings/<company>)
@@ -12,17 +18,45 @@ Sources:
 """
 
 import re
+import os
 import html
-from datetime import datetime
-from urllib.parse import urlparse
+import json
+import time
+import pickle
+import asyncio
+import hashlib
 
 try:
     import httpx
 except ImportError:
     httpx = None
 
-from .queue import add_job, get_db
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    import brotli  # noqa: F401  (lets httpx decode br bodies)
+    _ACCEPT_ENCODING = "br, gzip"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip"
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+from .queue import add_jobs_bulk, url_exists
 from .detector import detect_from_url
+from .config import HTTP_CACHE_DIR, SCRAPE_CACHE_TTL_SEC, USER_AGENT
 
 
 def _require_httpx():
@@ -32,32 +66,144 @@ def _require_httpx():
     return True
 
 
-# -- Lever API -----------------------------------------------------------------
+def _make_client(pool_size: int = 5):
+    """Client shared by every scraper in a batch (one pool, one TLS handshake per host)."""
+    # Transport-level retries cover connect errors (DNS blips, resets)
+    limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+    transport = httpx.AsyncHTTPTransport(retries=2, http2=_HTTP2, limits=limits)
+    return httpx.AsyncClient(
+        transport=transport, timeout=15,
+        headers={"User-Agent": USER_AGENT, "Accept-Encoding": _ACCEPT_ENCODING},
+    )
 
-def scrape_lever_board(company_slug: str, role_filter: str = None) -> list:
-    """Scrape all jobs from a Lever company board via their public API."""
-    if not _require_httpx():
-        return []
 
-    jobs = []
-    url = f"https://api.lever.co/v0/postings/{company_slug}?mode=json"
+# -- Cache ---------------------------------------------------------------------
+
+def _cache_path(kind: str, key: str):
+    return HTTP_CACHE_DIR / f"{kind}-{hashlib.sha1(key.encode()).hexdigest()}.pkl"
+
 
+def _read_cache(path) -> dict:
     try:
-        resp = httpx.get(url, timeout=15)
-        if resp.status_code == 404:
-            # Try EU endpoint
-            resp = httpx.get(
-                f"https://api.eu.lever.co/v0/postings/{company_slug}?mode=json",
-                timeout=15,
-            )
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def _write_cache(path, entry: dict):
+    """Write atomically so a concurrent reader never sees a partial file."""
+    HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+
+def _conditional_headers(cached: dict) -> dict:
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
+
+
+def _store_validated(path, resp, data):
+    """Cache data only if the server gave us something to revalidate with."""
+    etag = resp.headers.get("etag")
+    last_modified = resp.headers.get("last-modified")
+    if etag or last_modified:
+        _write_cache(path, {"etag": etag, "last_modified": last_modified, "data": data})
+
+
+async def _get_json(client, url: str) -> object:
+    """
+    GET a JSON API, revalidating against the on-disk cache.
+    A 304 returns the cached parsed body. Raises httpx.HTTPStatusError.
+    """
+    path = _cache_path("http", url)
+    cached = _read_cache(path)
+
+    resp = await client.get(url, headers=_conditional_headers(cached))
+    if resp.status_code == 304 and cached:
+        return cached["data"]
+    resp.raise_for_status()
+    data = _loads(resp.content)
+
+    _store_validated(path, resp, data)
+    return data
+
+
+class UnexpectedJSON(ValueError):
+    """A response whose top level isn't the array _iter_json was asked for."""
+
+
+async def _iter_json(client, url: str, prefix: str):
+    """
+    Yield the items at an ijson prefix ("item" for a top-level array,
+    "jobs.item" for {"jobs": [...]}) one at a time. With ijson installed
+    they are parsed as the body downloads instead of after buffering it;
+    otherwise falls back to _get_json(). Raises httpx.HTTPStatusError, and
+    UnexpectedJSON when prefix is "item" but the body isn't an array.
+    """
+    top_level = prefix == "item"
+    if ijson is None:
+        data = await _get_json(client, url)
+        if top_level and not isinstance(data, list):
+            raise UnexpectedJSON(url)
+        for key in prefix.split(".")[:-1]:
+            data = data.get(key) if isinstance(data, dict) else None
+        for item in data if isinstance(data, list) else ():
+            yield item
+        return
+
+    path = _cache_path("items", url)
+    cached = _read_cache(path)
+    async with client.stream("GET", url, headers=_conditional_headers(cached)) as resp:
+        if resp.status_code == 304 and cached:
+            for item in cached["data"]:
+                yield item
+            return
         resp.raise_for_status()
-        postings = resp.json()
 
-        if not isinstance(postings, list):
-            print(f"[warn] Unexpected Lever response for {company_slug}")
-            return []
+        # Only hold on to the items if they can be revalidated later
+        keep = resp.headers.get("etag") or resp.headers.get("last-modified")
+        seen = []
+        events = ijson.sendable_list()
+        coro = ijson.items_coro(events, prefix, use_float=True)
+        checked = not top_level
+        async for chunk in resp.aiter_bytes():
+            if not checked and chunk.strip():
+                # An error object or changed schema would otherwise just
+                # match no items at the prefix
+                if not chunk.lstrip().startswith(b"["):
+                    raise UnexpectedJSON(url)
+                checked = True
+            coro.send(chunk)
+            if keep:
+                seen.extend(events)
+            for item in events:
+                yield item
+            del events[:]
+        coro.close()
+        for item in events:
+            yield item
+
+    if keep:
+        _store_validated(path, resp, seen + events)
+
+
+# -- Lever API -----------------------------------------------------------------
 
-        for p in postings:
+async def scrape_lever_board(client, company_slug: str, role_filter: str = None) -> list:
+    """Scrape all jobs from a Lever company board via their public API."""
+    jobs = []
+    rf = (role_filter or "").lower()
+
+    try:
+        async for p in _lever_postings(client, company_slug):
             title = p.get("text", "")
             hosted_url = p.get("hostedUrl", "")
             categories = p.get("categories", {})
@@ -68,22 +214,11 @@ def scrape_lever_board(company_slug: str, role_filter: str = None) -> list:
             if not title or not hosted_url:
                 continue
 
-            if role_filter and role_filter.lower() not in title.lower():
+            if rf and rf not in title.lower():
                 continue
 
-            # Build JD text from available fields
-            jd_parts = []
-            if p.get("descriptionPlain"):
-                jd_parts.append(p["descriptionPlain"])
-            for lst in p.get("lists", []):
-                if lst.get("text"):
-                    jd_parts.append(lst["text"])
-                if lst.get("content"):
-                    jd_parts.append(_strip_html(lst["content"]))
-            if p.get("additionalPlain"):
-                jd_parts.append(p["additionalPlain"])
-
-            jd_text = "\n\n".join(jd_parts) if jd_parts else None
+            # Already queued URLs would be ignored on insert; skip the JD build
+            jd_text = None if url_exists(hosted_url) else _lever_jd(p)
 
             jobs.append({
                 "company": company_slug,
@@ -98,28 +233,54 @@ def scrape_lever_board(company_slug: str, role_filter: str = None) -> list:
 
         print(f"[scrape] Lever/{company_slug}: {len(jobs)} jobs")
 
+    except UnexpectedJSON:
+        print(f"[warn] Unexpected Lever response for {company_slug}")
+        return []
     except Exception as e:
         print(f"[error] Lever scrape failed for {company_slug}: {e}")
 
     return jobs
 
 
+async def _lever_postings(client, company_slug: str):
+    url = f"https://api.lever.co/v0/postings/{company_slug}?mode=json"
+    try:
+        async for p in _iter_json(client, url, "item"):
+            yield p
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code != 404:
+            raise
+        # Try EU endpoint
+        url = f"https://api.eu.lever.co/v0/postings/{company_slug}?mode=json"
+        async for p in _iter_json(client, url, "item"):
+            yield p
+
+
+def _lever_lists(p: dict):
+    for lst in p.get("lists") or ():
+        if lst.get("text"):
+            yield lst["text"]
+        content = lst.get("content")
+        if content:
+            yield _strip_html(content)
+
+
+def _lever_jd(p: dict) -> str:
+    """Build JD text from a Lever posting's available fields."""
+    parts = (p.get("descriptionPlain"), *_lever_lists(p), p.get("additionalPlain"))
+    return "\n\n".join(x for x in parts if x) or None
+
+
 # -- Greenhouse API ------------------------------------------------------------
 
-def scrape_greenhouse_board(company_slug: str, role_filter: str = None) -> list:
+async def scrape_greenhouse_board(client, company_slug: str, role_filter: str = None) -> list:
     """Scrape all jobs from a Greenhouse company board via their public API."""
-    if not _require_httpx():
-        return []
-
     jobs = []
+    rf = (role_filter or "").lower()
     url = f"https://boards-api.greenhouse.io/v1/boards/{company_slug}/jobs?content=true"
 
     try:
-        resp = httpx.get(url, timeout=15)
-        resp.raise_for_status()
-        data = resp.json()
-
-        for job in data.get("jobs", []):
+        async for job in _iter_json(client, url, "jobs.item"):
             title = job.get("title", "")
             job_url = job.get("absolute_url", "")
             location = job.get("location", {}).get("name", "")
@@ -129,10 +290,12 @@ def scrape_greenhouse_board(company_slug: str, role_filter: str = None) -> list:
             if not title or not job_url:
                 continue
 
-            if role_filter and role_filter.lower() not in title.lower():
+            if rf and rf not in title.lower():
                 continue
 
-            jd_text = _strip_html(content) if content else None
+            jd_text = None
+            if content and not url_exists(job_url):
+                jd_text = _strip_html(content)
 
             jobs.append({
                 "company": company_slug,
@@ -155,20 +318,14 @@ def scrape_greenhouse_board(company_slug: str, role_filter: str = None) -> list:
 
 # -- Ashby API -----------------------------------------------------------------
 
-def scrape_ashby_board(company_slug: str, role_filter: str = None) -> list:
+async def scrape_ashby_board(client, company_slug: str, role_filter: str = None) -> list:
     """Scrape all jobs from an Ashby company board via their public API."""
-    if not _require_httpx():
-        return []
-
     jobs = []
+    rf = (role_filter or "").lower()
     url = f"https://api.ashbyhq.com/posting-api/job-board/{company_slug}"
 
     try:
-        resp = httpx.get(url, timeout=15)
-        resp.raise_for_status()
-        data = resp.json()
-
-        for job in data.get("jobs", []):
+        async for job in _iter_json(client, url, "jobs.item"):
             title = job.get("title", "")
             job_url = job.get("jobUrl", "")
             location = job.get("location", "")
@@ -180,14 +337,15 @@ def scrape_ashby_board(company_slug: str, role_filter: str = None) -> list:
             if not title or not job_url:
                 continue
 
-            if role_filter and role_filter.lower() not in title.lower():
+            if rf and rf not in title.lower():
                 continue
 
             jd_text = None
-            if job.get("descriptionPlain"):
-                jd_text = job["descriptionPlain"]
-            elif job.get("descriptionHtml"):
-                jd_text = _strip_html(job["descriptionHtml"])
+            if not url_exists(job_url):
+                if job.get("descriptionPlain"):
+                    jd_text = job["descriptionPlain"]
+                elif job.get("descriptionHtml"):
+                    jd_text = _strip_html(job["descriptionHtml"])
 
             loc_display = location
             if is_remote:
@@ -214,12 +372,10 @@ def scrape_ashby_board(company_slug: str, role_filter: str = None) -> list:
 
 # -- HackerNews Who's Hiring --------------------------------------------------
 
-def scrape_hn_whos_hiring(role_filter: str = None, max_items: int = 200) -> list:
+async def scrape_hn_whos_hiring(client, role_filter: str = None, max_items: int = 200) -> list:
     """Scrape the latest HN "Who's Hiring" thread via Algolia API."""
-    if not _require_httpx():
-        return []
-
     jobs = []
+    rf = (role_filter or "").lower()
 
     # Find the latest "Who's Hiring" thread
     search_url = "https://hn.algolia.com/api/v1/search_by_date"
@@ -230,9 +386,9 @@ def scrape_hn_whos_hiring(role_filter: str = None, max_items: int = 200) -> list
     }
 
     try:
-        resp = httpx.get(search_url, params=params, timeout=15)
+        resp = await client.get(search_url, params=params)
         resp.raise_for_status()
-        data = resp.json()
+        data = _loads(resp.content)
 
         if not data.get("hits"):
             print("[warn] No Who's Hiring thread found")
@@ -244,11 +400,13 @@ def scrape_hn_whos_hiring(role_filter: str = None, max_items: int = 200) -> list
 
         # Fetch comments
         item_url = f"https://hn.algolia.com/api/v1/items/{thread_id}"
-        resp = httpx.get(item_url, timeout=30)
+        resp = await client.get(item_url, timeout=30)
         resp.raise_for_status()
-        thread_data = resp.json()
+        # Popular threads run to tens of MB; decode without stalling other scrapes
+        thread_data = await asyncio.to_thread(_loads, resp.content)
 
         children = thread_data.get("children", [])[:max_items]
+        seen = set()
         print(f"[scrape] Processing {len(children)} comments")
 
         for comment in children:
@@ -257,8 +415,13 @@ def scrape_hn_whos_hiring(role_filter: str = None, max_items: int = 200) -> list
                 continue
 
             # HN format: "Company Name | Role | Location | ..."
-            lines = text.replace("<p>", "\n").split("\n")
-            first_line = _strip_html(lines[0]).strip()
+            # Only the first line matters; don't split the whole comment
+            cut = text.find("<p>")
+            raw = text if cut < 0 else text[:cut]
+            nl = raw.find("\n")
+            if nl >= 0:
+                raw = raw[:nl]
+            first_line = _strip_html(raw).strip()
 
             if not first_line or len(first_line) < 5:
                 continue
@@ -271,29 +434,29 @@ def scrape_hn_whos_hiring(role_filter: str = None, max_items: int = 200) -> list
             role_text = parts[1] if len(parts) > 1 else ""
             location = parts[2] if len(parts) > 2 else ""
 
-            if role_filter and role_filter.lower() not in role_text.lower():
+            if rf and rf not in role_text.lower():
                 continue
 
-            # Extract job application URLs
-            urls = re.findall(r'href="(https?://[^"]+)"', text)
+            # Extract the first application-looking URL, else the first URL
             apply_url = ""
-            for u in urls:
-                if any(kw in u.lower() for kw in [
-                    "lever", "greenhouse", "ashby", "careers", "jobs",
-                    "apply", "workday", "hire", "recruiting"
-                ]):
+            first = None
+            for m in _HREF_RE.finditer(text):
+                u = m.group(1)
+                first = first or u
+                if _APPLY_KW_RE.search(u):
                     apply_url = u
                     break
-            if not apply_url and urls:
-                apply_url = urls[0]
+            apply_url = apply_url or first
 
-            if not apply_url:
+            # Same link posted in several comments: the queue keeps one anyway
+            if not apply_url or apply_url in seen:
                 continue
+            seen.add(apply_url)
 
             platform = detect_from_url(apply_url)
 
             # Build JD from the full comment text
-            jd_text = _strip_html(text)
+            jd_text = None if url_exists(apply_url) else _strip_html(text)
 
             jobs.append({
                 "company": company[:50],
@@ -315,40 +478,44 @@ def scrape_hn_whos_hiring(role_filter: str = None, max_items: int = 200) -> list
 
 # -- Helpers -------------------------------------------------------------------
 
+# One pass over the markup: <br>, <li> and <p> become line breaks, every
+# other tag is dropped. The matched group number picks the replacement.
+_TAG_RE = re.compile(r'<(?:(br)\s*/?|(li)|(p))>|<[^>]+>', re.IGNORECASE)
+_TAG_REPL = {1: "\n", 2: "\n- ", 3: "\n\n"}
+_BLANKS_RE = re.compile(r'\n{3,}')
+_HREF_RE = re.compile(r'href="(https?://[^"]+)"')
+# URLs in HN comments that look like an application link
+_APPLY_KW_RE = re.compile(
+    r'lever|greenhouse|ashby|careers|jobs|apply|workday|hire|recruiting', re.IGNORECASE,
+)
+
+def _tag_repl(m) -> str:
+    return _TAG_REPL.get(m.lastindex, "")
+
+
 def _strip_html(text: str) -> str:
     """Remove HTML tags and decode entities."""
-    text = re.sub(r'<br\s*/?>', '\n', text)
-    text = re.sub(r'<li>', '\n- ', text)
-    text = re.sub(r'<p>', '\n\n', text)
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _TAG_RE.sub(_tag_repl, text)
     text = html.unescape(text)
     # Collapse multiple blank lines
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _BLANKS_RE.sub('\n\n', text)
     return text.strip()
 
 
 def add_scraped_jobs(jobs: list, source: str = "scraper") -> dict:
-    """Add a list of scraped jobs to the queue. Returns stats."""
-    stats = {"added": 0, "skipped": 0, "total": len(jobs)}
-    for job in jobs:
-        job_id = add_job(
-            company=job["company"],
-            role=job["role"],
-            url=job["url"],
-            platform=job.get("platform", "unknown"),
-            jd_text=job.get("jd_text"),
-            source=job.get("source", source),
-        )
-        if job_id > 0:
-            stats["added"] += 1
-        else:
-            stats["skipped"] += 1
-    return stats
+    """Add a list of scraped jobs to the queue in one transaction. Returns stats."""
+    rows = [
+        (j["company"], j["role"], j["url"], j.get("platform", "unknown"),
+         j.get("jd_text"), j.get("source", source))
+        for j in jobs
+    ]
+    added, skipped = add_jobs_bulk(rows)
+    return {"added": added, "skipped": skipped, "total": len(jobs)}
 
 
 # -- Public API ----------------------------------------------------------------
 
-def scrape(source: str, query: str = None, **kwargs) -> list:
+async def scrape(source: str, query: str = None, client=None, **kwargs) -> list:
     """
     Main scrape dispatcher. All scrapers use HTTP APIs, no browser needed.
 
@@ -359,19 +526,67 @@ def scrape(source: str, query: str = None, **kwargs) -> list:
       hn                   - HackerNews Who's Hiring (Algolia API)
 
     query: optional role filter (e.g. "software engineer", "ml")
+    client: shared httpx.AsyncClient; a private one is opened if omitted
     """
+    if not _require_httpx():
+        return []
+
+    cache = _cache_path("jobs", f"{source}|{query or ''}")
+    cached = _read_cache(cache)
+    if cached and time.time() - cached["at"] < SCRAPE_CACHE_TTL_SEC:
+        print(f"[scrape] {source}: {len(cached['jobs'])} jobs (cached)")
+        return cached["jobs"]
+
+    if client is None:
+        async with _make_client() as client:
+            jobs = await _dispatch(client, source, query)
+    else:
+        jobs = await _dispatch(client, source, query)
+    if jobs:
+        _write_cache(cache, {"at": time.time(), "jobs": jobs})
+    return jobs
+
+
+async def _dispatch(client, source: str, query: str) -> list:
     if source.startswith("lever:"):
         company = source.split(":", 1)[1]
-        return scrape_lever_board(company, query)
+        return await scrape_lever_board(client, company, query)
     elif source.startswith("greenhouse:"):
         company = source.split(":", 1)[1]
-        return scrape_greenhouse_board(company, query)
+        return await scrape_greenhouse_board(client, company, query)
     elif source.startswith("ashby:"):
         company = source.split(":", 1)[1]
-        return scrape_ashby_board(company, query)
+        return await scrape_ashby_board(client, company, query)
     elif source == "hn":
-        return scrape_hn_whos_hiring(query)
+        return await scrape_hn_whos_hiring(client, query)
     else:
         print(f"[error] Unknown source: {source}")
         print("  Available: lever:<company>, greenhouse:<company>, ashby:<company>, hn")
         return []
+
+
+async def scrape_many(sources: list, query: str = None, max_concurrency: int = 5) -> list:
+    """
+    Scrape several sources concurrently over one shared client.
+    At most max_concurrency requests are in flight. Returns all jobs found.
+    """
+    if not _require_httpx():
+        return []
+
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def _guard(source):
+        async with sem:
+            return await scrape(source, query, client=client)
+
+    # Never more connections in flight than scrapes allowed to run at once
+    async with _make_client(max(1, min(len(sources), max_concurrency))) as client:
+        results = await asyncio.gather(*(_guard(s) for s in sources), return_exceptions=True)
+
+    jobs = []
+    for source, result in zip(sources, results):
+        if isinstance(result, Exception):
+            print(f"[error] {source}: {result}")
+            continue
+        jobs.extend(result)
+    return jobs
@@ -0,0 +1,2 @@
+# Tartarus - Resume tailoring and aesthetic checks
+# Part of application-tartarus
@@ -10,14 +10,33 @@ Usage:
 """
 
 import argparse
+import enum
+import hashlib
+import json
+import mmap
+import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from dataclasses import dataclass
+from typing import ClassVar
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader  # libyaml
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # --- Config ---
 # Calibrated empirically against rendered PDF: 10pt Times New Roman,
 # US Letter, 0.4in L/R margins, 3.8cm date column.
@@ -29,18 +48,32 @@ MAX_PAGE_LINES = 58      # approximate content lines per page
 RESUME_DIR = Path(__file__).parent
 RESUME_YAML = RESUME_DIR / "resume_data.yaml"
 RESUME_TEMPLATE = RESUME_DIR / "resume.example.yaml"
+AUDIT_CACHE = RESUME_DIR / ".audit_cache.json"
+
+_EMPTY = ()  # shared stand-in for a missing highlights list
 
 
 # --- Issue tracking ---
-@dataclass
+class Kind(enum.IntEnum):
+    """What an Issue is about, so callers needn't parse `what`."""
+    OTHER = 0
+    OVERFLOW = 1    # a title, bullet or skill line too wide for its column
+    UNDERFULL = 2   # page has room to spare
+    OVERFULL = 3    # page likely spills onto a second one
+
+
+@dataclass(slots=True, frozen=True)
 class Issue:
     level: str   # error, warn, info
     where: str   # e.g. "Experience > Exiger LLC"
     what: str    # human-readable description
+    kind: Kind = Kind.OTHER
+
+    _ICONS: ClassVar[dict] = {"error": "[ERR]", "warn": "[WARN]", "info": "[INFO]"}
 
     @property
     def icon(self):
-        return {"error": "[ERR]", "warn": "[WARN]", "info": "[INFO]"}.get(self.level, "[?]")
+        return Issue._ICONS.get(self.level, "[?]")
 
     def __str__(self):
         return f"  {self.icon} {self.where}\n     {self.what}"
@@ -65,53 +98,104 @@ def experience_title(e):
     return t
 
 
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
+
+
 def project_title(e):
     name = e.get("name", "")
-    return re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', name)  # strip markdown links
+    # Most names have no link; a substring test is far cheaper than the regex
+    if "[" not in name or "](" not in name:
+        return name
+    return _MD_LINK_RE.sub(r'\1', name)  # strip markdown links
 
 
 # --- Checks ---
 def check_section(entries, section_name, title_fn, issues):
-    """Check titles and bullets for a section."""
+    """Check titles and bullets for a section. Returns the number of bullets."""
+    n_bullets = 0
     for entry in entries:
         title = title_fn(entry)
         label = f"{section_name} > {title[:50]}"
 
-        if len(title) > MAX_TITLE_CHARS:
+        tlen = len(title)
+        if tlen > MAX_TITLE_CHARS:
             issues.append(Issue(
-                "error" if len(title) > MAX_TITLE_CHARS + 15 else "warn",
-                label, f"Title overflow ({len(title)} chars, max ~{MAX_TITLE_CHARS})"
+                "error" if tlen > MAX_TITLE_CHARS + 15 else "warn",
+                label, f"Title overflow ({tlen} chars, max ~{MAX_TITLE_CHARS})",
+                Kind.OVERFLOW,
             ))
 
-        for i, bullet in enumerate(entry.get("highlights") or []):
-            if len(bullet) > MAX_BULLET_CHARS:
-                severity = "warn" if len(bullet) < MAX_BULLET_CHARS + 15 else "error"
-                preview = bullet[:70] + "…" if len(bullet) > 70 else bullet
-                issues.append(Issue(
-                    severity, label,
-                    f"Bullet {i+1} overflow ({len(bullet)} chars): \"{preview}\""
-                ))
+        highlights = entry.get("highlights") or _EMPTY
+        n_bullets += len(highlights)
+        # max(map(len, ...)) runs entirely in C; only walk the bullets in
+        # Python when at least one of them actually overflows
+        if not highlights or max(map(len, highlights)) <= MAX_BULLET_CHARS:
+            continue
+        for i, bullet in enumerate(highlights):
+            blen = len(bullet)
+            if blen <= MAX_BULLET_CHARS:
+                continue
+            severity = "warn" if blen < MAX_BULLET_CHARS + 15 else "error"
+            preview = bullet[:70] + "…" if blen > 70 else bullet
+            issues.append(Issue(
+                severity, label,
+                f"Bullet {i+1} overflow ({blen} chars): \"{preview}\"",
+                Kind.OVERFLOW,
+            ))
+    return n_bullets
 
 
 def check_skills(entries, issues):
     for entry in entries:
         line = f"{entry.get('label', '')}: {entry.get('details', '')}"
-        if len(line) > MAX_FULL_CHARS:
-            issues.append(Issue(
-                "warn", f"Skills > {entry.get('label', '?')}",
-                f"Line overflow ({len(line)} chars, max ~{MAX_FULL_CHARS})"
-            ))
+        llen = len(line)
+        if llen <= MAX_FULL_CHARS:
+            continue
+        issues.append(Issue(
+            "warn", f"Skills > {entry.get('label', '?')}",
+            f"Line overflow ({llen} chars, max ~{MAX_FULL_CHARS})",
+            Kind.OVERFLOW,
+        ))
+
+
+def section_counts(sections):
+    """(entries, bullets, skill lines) across a resume's sections."""
+    n_entries = n_bullets = 0
+    for key in ("education", "experience", "projects"):
+        entries = sections.get(key) or _EMPTY
+        n_entries += len(entries)
+        n_bullets += sum(len(e.get("highlights") or _EMPTY) for e in entries)
+    n_skills = len(sections.get("skills") or _EMPTY)
+    return n_entries, n_bullets, n_skills
 
 
 def check_page_fill(sections, issues, design=None):
     """Heuristic for page utilization, accounting for spacing."""
-    n_bullets = sum(
-        len(e.get("highlights") or [])
-        for key in ("education", "experience", "projects")
-        for e in sections.get(key, [])
-    )
-    n_entries = sum(len(sections.get(k, [])) for k in ("education", "experience", "projects"))
-    n_skills = len(sections.get("skills", []))
+    check_fill_counts(*section_counts(sections), issues, design)
+
+
+def estimate_page_lines(sections, design=None):
+    """Estimated rendered lines for a sections dict; compare with MAX_PAGE_LINES."""
+    return estimate_lines(*section_counts(sections), design)
+
+
+def check_fill_counts(n_entries, n_bullets, n_skills, issues, design=None):
+    """Page-fill estimate from counts already gathered by the other checks."""
+    estimated = estimate_lines(n_entries, n_bullets, n_skills, design)
+    # Spacing makes the estimate fractional: snap it to thousandths of a line,
+    # then the percentage is exact integer division (no 59.999... -> 59)
+    fill = min(100, round(estimated * 1000) // (MAX_PAGE_LINES * 10))
+
+    if fill < 75:
+        issues.append(Issue("info", "Layout", f"Page ~{fill}% full - room to add content",
+                            Kind.UNDERFULL))
+    elif fill > 98:
+        issues.append(Issue("warn", "Layout", f"Page ~{fill}% full - risk of page 2 overflow",
+                            Kind.OVERFULL))
+
+
+def estimate_lines(n_entries, n_bullets, n_skills, design=None):
+    """Line model behind the page-fill check: content lines plus em spacing."""
     n_sections = 4  # education, skills, experience, projects headers
 
     # Account for spacing between entries (default 0.5em = ~0.5 lines)
@@ -129,43 +213,225 @@ def check_page_fill(sections, issues, design=None):
             section_spacing = float(sa[:-2]) * 2.5  # rough cm to line conversion
 
     spacing_lines = (n_entries - n_sections) * entry_spacing + n_sections * section_spacing
-    estimated = n_entries + n_bullets + n_skills + n_sections + spacing_lines
-    fill = min(100, int(estimated / MAX_PAGE_LINES * 100))
-
-    if fill < 75:
-        issues.append(Issue("info", "Layout", f"Page ~{fill}% full - room to add content"))
-    elif fill > 98:
-        issues.append(Issue("warn", "Layout", f"Page ~{fill}% full - risk of page 2 overflow"))
+    return n_entries + n_bullets + n_skills + n_sections + spacing_lines
+
+
+SECTIONS = (
+    ("education", "Education", education_title),
+    ("experience", "Experience", experience_title),
+    ("projects", "Projects", project_title),
+)
+
+
+def _child(node, key):
+    """Value node under `key` in a mapping node (last one wins, as in safe_load)."""
+    found = None
+    if isinstance(node, yaml.MappingNode):
+        for k, v in node.value:
+            if isinstance(k, yaml.ScalarNode) and k.value == key:
+                found = v
+    return found
+
+
+def load_audit_data(yaml_path):
+    """
+    What audit() reads, as (sections, design). Served from a .audit.json
+    sidecar when it was written for the YAML's current mtime and size;
+    otherwise parsed from the YAML and written back to the sidecar. A .json
+    resume is read as-is.
+    """
+    if str(yaml_path).endswith(".json"):
+        # Same document as JSON: no YAML parse, so no sidecar either
+        with open(yaml_path, "rb") as f:
+            data = _json_loads(f.read()) or {}
+        return (data.get("cv") or {}).get("sections") or {}, data.get("design") or {}
+
+    sidecar = Path(yaml_path).with_suffix(".audit.json")
+    # Keyed on the YAML's exact mtime and size, like the audit cache: a file
+    # restored with an older mtime (cp -p, tar, git checkout) must not match
+    st = os.stat(yaml_path)
+    key = [st.st_mtime_ns, st.st_size]
+    try:
+        with open(sidecar, "rb") as f:
+            data = _json_loads(f.read())
+        if data["key"] == key:
+            return data["sections"], data["design"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    sections, design = parse_audit_data(yaml_path)
+    try:
+        tmp = sidecar.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            # default=str: YAML dates only matter to rendercv, not the audit
+            json.dump({"key": key, "sections": sections, "design": design}, f,
+                      ensure_ascii=False, default=str)
+        os.replace(tmp, sidecar)
+    except (OSError, TypeError, ValueError):
+        pass  # read-only dir etc. - just parse again next time
+    return sections, design
+
+
+def parse_audit_data(yaml_path):
+    """Parse cv.sections and design from a YAML file. Returns (sections, design)."""
+    with open(yaml_path, "rb") as f:
+        return parse_audit_stream(f)
+
+
+def parse_audit_stream(stream):
+    """
+    Parse only cv.sections and design from YAML text or a file object. The
+    rest of the document is composed into nodes but never built into Python
+    objects. Returns (sections, design).
+    """
+    loader = _Loader(stream)
+    try:
+        root = loader.get_single_node()
+        sections = _child(_child(root, "cv"), "sections")
+        design = _child(root, "design")
+        return (
+            loader.construct_document(sections) if sections else {},
+            loader.construct_document(design) if design else {},
+        )
+    finally:
+        loader.dispose()
 
 
 def audit(yaml_path):
     """Full aesthetic audit of a resume YAML. Returns list of Issues."""
-    with open(yaml_path) as f:
-        data = yaml.safe_load(f)
+    return audit_sections(*load_audit_data(yaml_path))
+
+
+@lru_cache(maxsize=64)
+def _parse_audit_text(text):
+    # Shared between callers: audit_sections() only reads what it's given
+    return parse_audit_stream(text)
+
 
-    sections = data.get("cv", {}).get("sections", {})
+def audit_stream(stream):
+    """audit() for YAML already in memory (text or file object); no sidecar.
+    Text is parsed once per distinct document."""
+    if isinstance(stream, (str, bytes)):
+        return audit_sections(*_parse_audit_text(stream))
+    return audit_sections(*parse_audit_stream(stream))
+
+
+def audit_sections(sections, design=None):
+    """Run every check over parsed sections. Returns list of Issues."""
     issues = []
 
-    check_section(sections.get("education", []), "Education", education_title, issues)
-    check_section(sections.get("experience", []), "Experience", experience_title, issues)
-    check_section(sections.get("projects", []), "Projects", project_title, issues)
-    check_skills(sections.get("skills", []), issues)
-    design = data.get("design", {})
-    check_page_fill(sections, issues, design)
+    # One walk over the entries: check_section counts bullets as it goes,
+    # so the page-fill estimate doesn't traverse the sections again
+    n_entries = n_bullets = 0
+    for key, name, title_fn in SECTIONS:
+        entries = sections.get(key, [])
+        n_entries += len(entries)
+        n_bullets += check_section(entries, name, title_fn, issues)
+    skills = sections.get("skills", [])
+    check_skills(skills, issues)
+    check_fill_counts(n_entries, n_bullets, len(skills), issues, design)
 
     return issues
 
 
-def render(yaml_path):
+# --- Audit cache (skip unchanged files) ---
+# Cached issues are only valid for the limits they were computed with
+_LIMITS = [MAX_BULLET_CHARS, MAX_FULL_CHARS, MAX_TITLE_CHARS, MAX_PAGE_LINES]
+_CACHE_FORMAT = 2  # bump when the stored issue rows change shape
+
+
+def load_audit_cache():
+    try:
+        with open(AUDIT_CACHE) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("limits") != _LIMITS or data.get("format") != _CACHE_FORMAT:
+        return {}
+    return data.get("files", {})
+
+
+def save_audit_cache(cache):
+    tmp = AUDIT_CACHE.with_suffix(".tmp")
+    try:
+        with open(tmp, "w") as f:
+            json.dump({"limits": _LIMITS, "format": _CACHE_FORMAT, "files": cache}, f)
+        os.replace(tmp, AUDIT_CACHE)
+    except OSError as e:
+        # Read-only or full directory: the audits already ran, just re-run them next time
+        print(f"[warn] Audit cache not saved: {e}")
+
+
+def file_digest(yaml_path):
+    with open(yaml_path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.blake2b(mm, digest_size=16).hexdigest()
+        except ValueError:  # empty files can't be mapped
+            return hashlib.blake2b(b"", digest_size=16).hexdigest()
+
+
+def cache_lookup(cache, yaml_path, st):
+    """
+    Cached issues for yaml_path, or None. If mtime/size changed, falls back to
+    a content hash, which also matches variants copied from another file.
+    Returns (issues, digest); digest is None when the stat check alone hit.
+    """
+    entry = cache.get(str(yaml_path.resolve()))
+    if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+        return [_cached_issue(i) for i in entry["issues"]], None
+
+    digest = file_digest(yaml_path)
+    for entry in cache.values():
+        if entry.get("digest") == digest:
+            return [_cached_issue(i) for i in entry["issues"]], digest
+    return None, digest
+
+
+def cache_store(cache, yaml_path, st, digest, issues):
+    cache[str(yaml_path.resolve())] = {
+        "mtime_ns": st.st_mtime_ns, "size": st.st_size, "digest": digest,
+        "issues": [(i.level, i.where, i.what, int(i.kind)) for i in issues],
+    }
+
+
+def _cached_issue(row):
+    level, where, what, kind = row
+    return Issue(level, where, what, Kind(kind))
+
+
+def run_render(yaml_path):
+    """Render with rendercv. Returns None on success, else its stderr."""
+    # Only stderr is ever shown; let the LaTeX log go to /dev/null
     result = subprocess.run(
         ["rendercv", "render", str(yaml_path)],
-        capture_output=True, text=True, cwd=str(yaml_path.parent)
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, cwd=str(yaml_path.parent)
     )
-    if result.returncode != 0:
-        print(f"  [error] Render failed:\n{result.stderr}")
-        return False
-    print(f"  [ok] Rendered")
-    return True
+    return None if result.returncode == 0 else result.stderr.decode("utf-8", "replace")
+
+
+def print_render(err):
+    if err is not None:
+        print(f"  [error] Render failed:\n{err}")
+    else:
+        print(f"  [ok] Rendered")
+
+
+def render(yaml_path):
+    err = run_render(yaml_path)
+    print_render(err)
+    return err is None
+
+
+def audit_and_render(yaml_path, issues=None, no_render=False):
+    """
+    One file's work, top-level so a process pool can pickle it. Pass issues
+    to skip the audit (cache hit). Returns (issues, render error or None).
+    """
+    if issues is None:
+        issues = audit(yaml_path)
+    err = None if no_render else run_render(yaml_path)
+    return issues, err
 
 
 # --- Main ---
@@ -179,38 +445,76 @@ def main():
 
     # Collect files to check
     files = []
+    stats = {}
     if args.all:
         base = RESUME_DIR / "resume_data.yaml"
-        if base.exists():
+        try:
+            stats[base] = os.stat(base)
             files.append(base)
-        for variant in sorted((RESUME_DIR / "output").glob("*/resume_data.yaml")):
-            files.append(variant)
+        except FileNotFoundError:
+            pass
+        # One scandir pass over output/ instead of a glob. The stat that
+        # proves a variant exists is kept for the cache check below.
+        out = RESUME_DIR / "output"
+        if out.exists():
+            with os.scandir(out) as it:
+                dirs = sorted(e.path for e in it if e.is_dir(follow_symlinks=False))
+            for d in dirs:
+                candidate = os.path.join(d, "resume_data.yaml")
+                try:
+                    st = os.stat(candidate)
+                except FileNotFoundError:
+                    continue
+                variant = Path(candidate)
+                stats[variant] = st
+                files.append(variant)
     else:
         p = Path(args.yaml)
         files.append(p if p.exists() else RESUME_DIR / args.yaml)
 
-    # Run audits
-    total_errors = 0
+    # Cache hits skip the audit; rendering still runs for every file
+    cache = load_audit_cache()
+    jobs = []
     for f in files:
-        if not f.exists():
-            print(f"[error] Not found: {f}")
-            continue
+        st = stats.get(f)
+        if st is None:
+            try:
+                st = f.stat()
+            except FileNotFoundError:
+                print(f"[error] Not found: {f}")
+                continue
+        jobs.append((f, st, *cache_lookup(cache, f, st)))
+
+    # Variants are independent: spread audit + render across cores
+    work = partial(audit_and_render, no_render=args.no_render)
+    paths = [f for f, _, _, _ in jobs]
+    cached = [c for _, _, c, _ in jobs]
+    if len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as ex:
+            results = list(ex.map(work, paths, cached))
+    else:
+        results = [work(f, c) for f, c in zip(paths, cached)]
+
+    total_errors = 0
+    for (f, st, _, digest), (issues, render_err) in zip(jobs, results):
+        if digest is not None:
+            cache_store(cache, f, st, digest, issues)
 
         name = f.parent.name if f.parent != RESUME_DIR else "base"
-        issues = audit(f)
         errors = [i for i in issues if i.level == "error"]
         total_errors += len(errors)
 
         if issues:
             print(f"\n[audit] {name} - {len(issues)} issue(s):")
-            for issue in issues:
-                print(issue)
+            sys.stdout.write("\n".join(map(str, issues)))
+            sys.stdout.write("\n")
         else:
             print(f"\n[ok] {name} - clean")
 
         if not args.no_render:
-            render(f)
+            print_render(render_err)
 
+    save_audit_cache(cache)
     sys.exit(1 if total_errors > 0 else 0)
 
 
@@ -24,24 +24,51 @@ What it does:
 
 import sys
 import os
+import stat
 import json
-import shutil
-import subprocess
 import re
-import yaml
+import pickle
+import mmap
+import time
+import hashlib
 from pathlib import Path
 from datetime import datetime
-from copy import deepcopy
+from functools import lru_cache
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj, indent=False) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj, indent=False) -> str:
+        return json.dumps(obj, indent=2 if indent else None)
 
 BASE_DIR = Path(__file__).parent
 RESUME_DATA = BASE_DIR / "resume_data.yaml"
 TEMPLATE_YAML = BASE_DIR / "resume.example.yaml"
 OUTPUT_DIR = BASE_DIR / "output"
 JD_DIR = BASE_DIR / "jd"
+BASE_CACHE = BASE_DIR / ".base_cache.pkl"
+AI_CACHE_DIR = BASE_DIR / ".ai_cache"
+AI_CACHE_MAX_AGE_SEC = 30 * 86400
+AI_MODEL = "claude-sonnet-4-20250514"
 
 MAX_PAGES = 1
 MAX_BULLET_CHARS = 135
 
+_PDF_PAGE_RE = re.compile(rb'/Type\s*/Page[^s]')
+_FENCE_RE = re.compile(r'^```(?:json)?\n?(.*?)(?:\n?```)?$', re.S)
+_BULLET_KEY_RE = re.compile(r'(\w+)\[(\d+)\]\.highlights\[(\d+)\]')
+
 
 # -- Profile Definitions ----------------------------------------------------
 
@@ -121,10 +148,66 @@ PROFILES = {
 }
 
 
+def _build_keyword_automaton():
+    """One Aho-Corasick automaton over every profile keyword (None without pyahocorasick)."""
+    if ahocorasick is None:
+        return None
+    owners = {}
+    for name, prof in PROFILES.items():
+        for kw in prof["keywords"]:
+            owners.setdefault(kw, []).append(name)
+    automaton = ahocorasick.Automaton()
+    for kw, names in owners.items():
+        automaton.add_word(kw, (kw, tuple(names)))
+    automaton.make_automaton()
+    return automaton
+
+
+_KW_AUTOMATON = _build_keyword_automaton()
+
+
 # -- Helpers -----------------------------------------------------------------
 
+@lru_cache(maxsize=None)
+def _yaml():
+    """PyYAML plus its fastest safe loader/dumper, imported on first use.
+
+    `list`, `profiles` and warm load_base() cache hits never need it.
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader, CSafeDumper as dumper  # libyaml
+    except ImportError:
+        from yaml import SafeLoader as loader, SafeDumper as dumper
+    return yaml, loader, dumper
+
+
+def _yaml_load(f):
+    yaml, loader, _ = _yaml()
+    return yaml.load(f, Loader=loader)
+
+
+def _yaml_write(data, path: Path):
+    """Dump data to path: serialized straight to UTF-8 bytes, then one write."""
+    yaml, _, dumper = _yaml()
+    path.write_bytes(yaml.dump(data, Dumper=dumper, default_flow_style=False, allow_unicode=True,
+                               sort_keys=False, width=200, encoding="utf-8"))
+
+
+_SLUG_TABLE = str.maketrans({
+    c: "-" for c in map(chr, range(128)) if not ("a" <= c <= "z" or "0" <= c <= "9")
+})
+
+
 def slugify(text: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+    text = text.lower()
+    if not text.isascii():
+        # The table only covers ASCII; keep the regex for anything else
+        return re.sub(r"[^a-z0-9]+", "-", text).strip("-")
+    slug = text.translate(_SLUG_TABLE)
+    while "--" in slug:
+        slug = slug.replace("--", "-")
+    return slug.strip("-")
 
 
 def get_name_from_yaml(data: dict) -> str:
@@ -140,26 +223,55 @@ def load_base():
         sys.exit(1)
     if yaml_path == TEMPLATE_YAML:
         print("[warn] Using template. Copy resume.example.yaml to resume_data.yaml for real data.")
-    with open(yaml_path) as f:
-        return yaml.safe_load(f)
+
+    # Parsed YAML is pickled, keyed on the source's path, mtime and size
+    st = yaml_path.stat()
+    key = (str(yaml_path), st.st_mtime_ns, st.st_size)
+    try:
+        with open(BASE_CACHE, "rb") as f:
+            cached_key, data = pickle.load(f)
+        if cached_key == key:
+            return data
+    except Exception:
+        pass
+
+    with open(yaml_path, "rb") as f:
+        data = _yaml_load(f)
+    try:
+        tmp = BASE_CACHE.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump((key, data), f, protocol=5)
+        os.replace(tmp, BASE_CACHE)
+    except OSError:
+        pass
+    return data
+
+
+def _read_text(path, size: int) -> str:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        text = os.read(fd, size).decode("utf-8", errors="replace")
+    finally:
+        os.close(fd)
+    # Universal newlines, as read_text() gave
+    return text.replace("\r\n", "\n").replace("\r", "\n")
 
 
 def read_jd(jd_input: str) -> str:
     """Read JD from file path or treat as raw text."""
     if len(jd_input) > 255 or "\n" in jd_input:
         return jd_input
-    path = Path(jd_input)
-    try:
-        if path.exists() and path.is_file():
-            return path.read_text()
-    except OSError:
-        return jd_input
-    jd_path = JD_DIR / jd_input
-    try:
-        if jd_path.exists():
-            return jd_path.read_text()
-    except OSError:
-        pass
+    # One stat per candidate: covers exists + is_file, and gives the size to read
+    for path in (jd_input, JD_DIR / jd_input):
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):  # missing, name too long, or an embedded NUL
+            continue
+        if stat.S_ISREG(st.st_mode):
+            try:
+                return _read_text(path, st.st_size)
+            except OSError:
+                pass
     return jd_input
 
 
@@ -167,39 +279,63 @@ def detect_profile(jd: str, role: str = "") -> str:
     """Score each profile against the JD. Role title gets 2x weight as tiebreaker."""
     jd_lower = jd.lower()
     role_lower = role.lower()
-    scores = {}
-    for name, prof in PROFILES.items():
-        score = sum(1 for kw in prof["keywords"] if kw in jd_lower)
-        title_bonus = sum(2 for kw in prof["keywords"] if kw in role_lower)
-        scores[name] = score + title_bonus
+    if _KW_AUTOMATON is not None:
+        # One pass per text; each distinct keyword counts once, as with `in`
+        scores = dict.fromkeys(PROFILES, 0)
+        for weight, text in ((1, jd_lower), (2, role_lower)):
+            for kw, names in {hit for _, hit in _KW_AUTOMATON.iter(text)}:
+                for name in names:
+                    scores[name] += weight
+    else:
+        scores = {}
+        for name, prof in PROFILES.items():
+            score = sum(1 for kw in prof["keywords"] if kw in jd_lower)
+            title_bonus = sum(2 for kw in prof["keywords"] if kw in role_lower)
+            scores[name] = score + title_bonus
     best = max(scores, key=scores.get)
     if scores[best] == 0:
         return "swe"
     return best
 
 
-def match_project(project: dict, name_fragment: str) -> bool:
-    pname = project.get("name", "")
-    return name_fragment.lower() in pname.lower()
+_WORD_RE = re.compile(r'[a-z]{3,}')
+_STOPWORDS = frozenset({
+    "the", "and", "for", "with", "that", "this", "from", "have", "has",
+    "will", "would", "could", "should", "been", "being", "were", "are",
+    "was", "not", "but", "also", "our", "you", "your", "they", "their",
+    "about", "into", "more", "other", "some", "can", "all", "each",
+})
+
 
+def jd_keywords(jd_text: str) -> frozenset:
+    """Words in the JD worth matching bullets against (stopwords removed)."""
+    return frozenset(_WORD_RE.findall(jd_text.lower())) - _STOPWORDS
 
-def score_bullet(bullet: str, emphasis_keywords: list, jd_words: set = None) -> int:
-    """Score a bullet by profile emphasis + JD word overlap."""
+
+def score_bullet(bullet: str, emphasis_keywords: list, jd_words: frozenset = None) -> int:
+    """Score a bullet by profile emphasis + JD word overlap. jd_words comes from jd_keywords()."""
     b_lower = bullet.lower()
-    b_words = set(re.findall(r'[a-z]{3,}', b_lower))
     score = sum(2 for kw in emphasis_keywords if kw in b_lower)
     if jd_words:
-        stopwords = {"the", "and", "for", "with", "that", "this", "from", "have", "has",
-                     "will", "would", "could", "should", "been", "being", "were", "are",
-                     "was", "not", "but", "also", "our", "you", "your", "they", "their",
-                     "about", "into", "more", "other", "some", "can", "all", "each"}
-        overlap = b_words & (jd_words - stopwords)
-        score += len(overlap)
+        score += len(jd_words.intersection(_WORD_RE.findall(b_lower)))
     return score
 
 
+@lru_cache(maxsize=None)
+def _pdf_page_db():
+    """Hyperscan database for _PDF_PAGE_RE, compiled on first use (None without hyperscan)."""
+    try:
+        import hyperscan
+        db = hyperscan.Database()
+        db.compile(expressions=[_PDF_PAGE_RE.pattern], ids=[0],
+                   flags=[hyperscan.HS_FLAG_SOM_LEFTMOST])
+        return db
+    except Exception:
+        return None
+
+
 def check_page_count(pdf_path: Path) -> int:
-    """Return page count of PDF. Uses pypdf if available, falls back to regex."""
+    """Return page count of PDF. Uses pypdf if available, falls back to a /Type /Page scan."""
     try:
         from pypdf import PdfReader
         reader = PdfReader(str(pdf_path))
@@ -207,8 +343,23 @@ def check_page_count(pdf_path: Path) -> int:
     except ImportError:
         pass
     try:
-        content = pdf_path.read_bytes()
-        pages = len(re.findall(rb'/Type\s*/Page[^s]', content))
+        with open(pdf_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return 1
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pages = None
+                db = _pdf_page_db()
+                if db is not None:
+                    hits = []
+                    try:
+                        # Hyperscan takes bytes, not a buffer
+                        db.scan(bytes(mm), match_event_handler=lambda *m: hits.append(1))
+                        pages = len(hits)
+                    except Exception:
+                        pass  # count with re below rather than report -1 ("fits")
+                if pages is None:
+                    # re scans the mapping directly, no copy
+                    pages = sum(1 for _ in _PDF_PAGE_RE.finditer(mm))
         return max(pages, 1)
     except Exception:
         return -1
@@ -216,6 +367,58 @@ def check_page_count(pdf_path: Path) -> int:
 
 # -- AI Text Proofing -------------------------------------------------------
 
+def _request_edits(httpx, api_key: str, prompt: str) -> dict:
+    """POST the proofing prompt and return the parsed {key: bullet} edits."""
+    # Streamed so the 60s timeout bounds the gap between tokens rather
+    # than the whole generation, which grows with the number of bullets
+    chunks = []
+    with httpx.stream(
+        "POST",
+        "https://api.anthropic.com/v1/messages",
+        headers={
+            "x-api-key": api_key,
+            "anthropic-version": "2023-06-01",
+            "content-type": "application/json",
+        },
+        json={
+            "model": AI_MODEL,
+            "max_tokens": 4096,
+            "stream": True,
+            "messages": [{"role": "user", "content": prompt}],
+        },
+        timeout=60,
+    ) as resp:
+        resp.raise_for_status()
+        for line in resp.iter_lines():
+            if not line.startswith("data:"):
+                continue
+            event = _json_loads(line[5:])
+            if event.get("type") == "content_block_delta":
+                chunks.append(event["delta"].get("text", ""))
+            elif event.get("type") == "error":
+                raise RuntimeError(event.get("error", {}).get("message", "stream error"))
+    text = "".join(chunks).strip()
+
+    fenced = _FENCE_RE.match(text)
+    if fenced:
+        text = fenced.group(1)
+
+    return _json_loads(text)
+
+
+def _prune_ai_cache():
+    """Drop cached AI responses older than AI_CACHE_MAX_AGE_SEC."""
+    if not AI_CACHE_DIR.exists():
+        return
+    cutoff = time.time() - AI_CACHE_MAX_AGE_SEC
+    for entry in os.scandir(AI_CACHE_DIR):
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+        except OSError:
+            pass
+
+
 def ai_proof_bullets(data: dict, company: str, role: str, jd_text: str, profile: str) -> dict:
     """
     Use Claude to lightly proof resume bullets with company-aware context.
@@ -270,38 +473,37 @@ Here are the resume bullets. For each one, return a lightly edited version. Rule
 Return ONLY a JSON object mapping each key to its edited bullet. No markdown, no explanation.
 
 Bullets:
-{json.dumps(all_bullets, indent=2)}"""
-
-    try:
-        resp = httpx.post(
-            "https://api.anthropic.com/v1/messages",
-            headers={
-                "x-api-key": api_key,
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json",
-            },
-            json={
-                "model": "claude-sonnet-4-20250514",
-                "max_tokens": 4096,
-                "messages": [{"role": "user", "content": prompt}],
-            },
-            timeout=60,
-        )
-        resp.raise_for_status()
-        result = resp.json()
-        text = result["content"][0]["text"].strip()
+{_json_dumps(all_bullets, indent=True)}"""
 
-        if text.startswith("```"):
-            text = re.sub(r'^```(?:json)?\n?', '', text)
-            text = re.sub(r'\n?```$', '', text)
+    # Same model + prompt (company, role, profile, bullets, JD) -> same edits;
+    # re-runs while iterating on a JD skip the round-trip entirely
+    cache_key = hashlib.sha256(json.dumps([AI_MODEL, prompt]).encode()).hexdigest()
+    cache_path = AI_CACHE_DIR / f"{cache_key}.json"
+    _prune_ai_cache()
 
-        edits = json.loads(text)
+    try:
+        edits = None
+        if cache_path.exists():
+            try:
+                edits = _json_loads(cache_path.read_bytes())
+                print("[ai] using cached edits")
+            except (OSError, ValueError):
+                edits = None
+        if edits is None:
+            edits = _request_edits(httpx, api_key, prompt)
+            try:
+                AI_CACHE_DIR.mkdir(exist_ok=True)
+                tmp = cache_path.with_suffix(f".{os.getpid()}.tmp")
+                tmp.write_text(_json_dumps(edits))
+                os.replace(tmp, cache_path)
+            except OSError:
+                pass
 
         changes = 0
         diff_log = []
         for key, new_bullet in edits.items():
             if key in all_bullets and new_bullet != all_bullets[key]:
-                match = re.match(r'(\w+)\[(\d+)\]\.highlights\[(\d+)\]', key)
+                match = _BULLET_KEY_RE.match(key)
                 if match:
                     section, i, j = match.group(1), int(match.group(2)), int(match.group(3))
                     old = all_bullets[key]
@@ -335,40 +537,50 @@ def trim_to_fit(data: dict, out_dir: Path, tailored_yaml: Path, name_prefix: str
                 slug: str, max_attempts: int = 5) -> Path:
     """
     Iteratively trim content until the resume fits on MAX_PAGES.
+
+    Once a render has overflowed, we only re-render when a trim could plausibly
+    have fixed it: while the audit's line estimate is still clearly past the
+    page budget, keep trimming without paying for another RenderCV run.
     """
+    import subprocess
+
+    try:
+        from check_resume import MAX_PAGE_LINES, estimate_page_lines
+    except ImportError:
+        estimate_page_lines = None
+
+    pages = None
+    skipped = 0
+    exhausted = False
     for attempt in range(max_attempts):
-        result = subprocess.run(
+        # Never skip the first or last render, nor more than twice in a row,
+        # so a miscalibrated estimate only costs trims we'd have made anyway
+        if (pages is not None and estimate_page_lines and skipped < 2
+                and attempt < max_attempts - 1):
+            est = estimate_page_lines(data["cv"]["sections"], data.get("design"))
+            if est > MAX_PAGES * MAX_PAGE_LINES * 1.05:
+                skipped += 1
+                print(f"[trim] Still ~{est:.0f} lines, trimming again before re-render...")
+                if _trim_once(data, tailored_yaml):
+                    continue
+                # Nothing left to cut, but the YAML has changed since the last
+                # render: render it once more so the PDF we return matches
+                exhausted = True
+        skipped = 0
+
+        # stdout is progress chatter we never show; only stderr is kept for errors
+        proc = subprocess.Popen(
             ["rendercv", "render", str(tailored_yaml)],
-            capture_output=True, text=True, cwd=str(out_dir),
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, cwd=str(out_dir),
         )
-
-        render_out = out_dir / "rendercv_output"
-        if render_out.exists():
-            for f in render_out.iterdir():
-                dest = out_dir / f.name
-                if dest.exists():
-                    dest.unlink()
-                shutil.move(str(f), str(dest))
-            render_out.rmdir()
-
-        # Find the rendered PDF (rendercv names it from the YAML name field)
-        rendered_pdfs = list(out_dir.glob("*.pdf"))
-        source_pdf = None
-        for p in rendered_pdfs:
-            if slug not in p.stem:
-                source_pdf = p
-                break
-
-        final_pdf = out_dir / f"{name_prefix}_{slug}.pdf"
-        if source_pdf and source_pdf.exists():
-            if final_pdf.exists():
-                final_pdf.unlink()
-            source_pdf.rename(final_pdf)
+        _, stderr = proc.communicate()
+        stderr = stderr.decode(errors="replace")
+        final_pdf = _finalize_render(out_dir, name_prefix, slug)
 
         if not final_pdf.exists():
             print("[error] RenderCV failed to produce PDF")
-            if result.stderr:
-                print(f"  stderr: {result.stderr[:500]}")
+            if stderr:
+                print(f"  stderr: {stderr[:500]}")
             return final_pdf
 
         pages = check_page_count(final_pdf)
@@ -377,43 +589,66 @@ def trim_to_fit(data: dict, out_dir: Path, tailored_yaml: Path, name_prefix: str
 
         print(f"[trim] Page overflow ({pages} pages), attempt {attempt + 1}...")
 
-        sections = data["cv"]["sections"]
+        if exhausted or not _trim_once(data, tailored_yaml):
+            print(f"[error] Cannot trim further, still {pages} pages.")
+            return final_pdf
 
-        exp = sections.get("experience", [])
-        longest = max(exp, key=lambda e: len(e.get("highlights", [])), default=None)
-        if longest and len(longest.get("highlights", [])) > 2:
-            removed = longest["highlights"].pop()
-            print(f"  Removed bullet from {longest.get('company', '?')}: \"{removed[:60]}...\"")
-            with open(tailored_yaml, "w") as f:
-                yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False, width=200)
-            continue
+    return final_pdf
 
-        projects = sections.get("projects", [])
-        if len(projects) > 2:
-            removed = projects.pop()
-            pname = removed.get("name", "?")
-            print(f"  Removed project: {pname[:60]}")
-            with open(tailored_yaml, "w") as f:
-                yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False, width=200)
-            continue
 
-        for section_name in ["experience", "projects"]:
-            for entry in sections.get(section_name, []):
-                if len(entry.get("highlights", [])) > 2:
-                    entry["highlights"].pop()
-                    with open(tailored_yaml, "w") as f:
-                        yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False, width=200)
-                    break
-            else:
-                continue
-            break
-        else:
-            print(f"[error] Cannot trim further, still {pages} pages.")
-            return final_pdf
+def _finalize_render(out_dir: Path, name_prefix: str, slug: str) -> Path:
+    """Move RenderCV's output up into out_dir and rename the PDF to its final name."""
+    import shutil
+
+    render_out = out_dir / "rendercv_output"
+    if render_out.exists():
+        for f in render_out.iterdir():
+            dest = out_dir / f.name
+            if dest.exists():
+                dest.unlink()
+            shutil.move(str(f), str(dest))
+        render_out.rmdir()
 
+    # Find the rendered PDF (rendercv names it from the YAML name field)
+    source_pdf = next((p for p in out_dir.glob("*.pdf") if slug not in p.stem), None)
+
+    final_pdf = out_dir / f"{name_prefix}_{slug}.pdf"
+    if source_pdf and source_pdf.exists():
+        if final_pdf.exists():
+            final_pdf.unlink()
+        source_pdf.rename(final_pdf)
     return final_pdf
 
 
+def _trim_once(data: dict, tailored_yaml: Path) -> bool:
+    """Drop one piece of content and rewrite the YAML. False if nothing left to cut."""
+    sections = data["cv"]["sections"]
+
+    exp = sections.get("experience", [])
+    longest = max(exp, key=lambda e: len(e.get("highlights", [])), default=None)
+    if longest and len(longest.get("highlights", [])) > 2:
+        removed = longest["highlights"].pop()
+        print(f"  Removed bullet from {longest.get('company', '?')}: \"{removed[:60]}...\"")
+        _yaml_write(data, tailored_yaml)
+        return True
+
+    projects = sections.get("projects", [])
+    if len(projects) > 2:
+        removed = projects.pop()
+        pname = removed.get("name", "?")
+        print(f"  Removed project: {pname[:60]}")
+        _yaml_write(data, tailored_yaml)
+        return True
+
+    for section_name in ["experience", "projects"]:
+        for entry in sections.get(section_name, []):
+            if len(entry.get("highlights", [])) > 2:
+                entry["highlights"].pop()
+                _yaml_write(data, tailored_yaml)
+                return True
+    return False
+
+
 # -- Main Tailoring Logic ----------------------------------------------------
 
 def tailor(company: str, role: str, jd: str, profile_override: str = None,
@@ -437,29 +672,40 @@ def tailor(company: str, role: str, jd: str, profile_override: str = None,
             edu["highlights"] = [f"Coursework: {prof['coursework']}"]
 
     # 2. Update skills
-    data["cv"]["sections"]["skills"] = deepcopy(prof["skills"])
+    # Skill entries are flat {label, details} dicts: a one-level copy is enough
+    # to keep later edits from reaching PROFILES
+    data["cv"]["sections"]["skills"] = [dict(s) for s in prof["skills"]]
 
     # 3. Reorder projects
     projects = data["cv"]["sections"].get("projects", [])
+    # A project matches when the order entry is a case-insensitive substring
+    # of its name. Names are lowercased once, and placed projects tracked by
+    # identity: dicts aren't hashable and `in` on a list compares each one
+    lowered = [(p.get("name", "").lower(), p) for p in projects]
     ordered = []
     for pname in prof["project_order"]:
-        for p in projects:
-            if match_project(p, pname):
+        frag = pname.lower()
+        for name, p in lowered:
+            if frag in name:
                 ordered.append(p)
                 break
+    placed = {id(p) for p in ordered}
     for p in projects:
-        if p not in ordered:
+        if id(p) not in placed:
             ordered.append(p)
     data["cv"]["sections"]["projects"] = ordered
 
     # 4. Score and reorder experience bullets by relevance
     emphasis = prof["experience_emphasis"]
-    jd_words = set(re.findall(r'[a-z]{3,}', jd_text.lower()))
+    jd_words = jd_keywords(jd_text)
+    def relevance(bullet):
+        return score_bullet(bullet, emphasis, jd_words)
+
+    # sorted() evaluates the key once per bullet and is stable under reverse=True,
+    # so ties keep their YAML order exactly as the old (score, bullet) pairs did
     for job in data["cv"]["sections"].get("experience", []):
         if job.get("highlights"):
-            scored = [(score_bullet(b, emphasis, jd_words), b) for b in job["highlights"]]
-            scored.sort(key=lambda x: x[0], reverse=True)
-            job["highlights"] = [b for _, b in scored]
+            job["highlights"] = sorted(job["highlights"], key=relevance, reverse=True)
 
     # 5. AI proofing
     if use_ai:
@@ -508,8 +754,7 @@ def tailor(company: str, role: str, jd: str, profile_override: str = None,
 
     # 8. Write tailored YAML
     tailored_yaml = out_dir / "resume_data.yaml"
-    with open(tailored_yaml, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False, width=200)
+    _yaml_write(data, tailored_yaml)
 
     # 9. Render + page check
     print("[render] generating PDF...")